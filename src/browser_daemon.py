@@ -0,0 +1,48 @@
+"""
+Standalone shared-browser daemon.
+
+Launches one headless Chromium with a remote debugging port and prints
+its CDP endpoint, so multiple scraper processes (CLI runs, workers,
+tests) can attach via `browser_cdp_endpoint` in scrape_config.yaml
+instead of each paying for their own browser launch.
+
+Usage:
+    python -m src.browser_daemon [--port 9222]
+
+Then set in scrape_config.yaml:
+    browser_cdp_endpoint: 'http://127.0.0.1:9222'
+"""
+
+import argparse
+import asyncio
+
+from playwright.async_api import async_playwright
+
+from .settings import DEFAULT_SCRAPE_CONFIG
+
+
+async def main(port: int) -> None:
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(
+            headless=DEFAULT_SCRAPE_CONFIG.browser_headless,
+            args=[f"--remote-debugging-port={port}"],
+        )
+        endpoint = f"http://127.0.0.1:{port}"
+        print(f"[browser-daemon] Chromium listening on {endpoint}")
+        print(f"[browser-daemon] set browser_cdp_endpoint: '{endpoint}' in scrape_config.yaml")
+        print("[browser-daemon] Ctrl+C to stop")
+        try:
+            # Keep the process (and browser) alive until interrupted.
+            await asyncio.Event().wait()
+        finally:
+            await browser.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a shared Chromium for scraper workers")
+    parser.add_argument("--port", type=int, default=9222, help="Remote debugging port")
+    args = parser.parse_args()
+    try:
+        asyncio.run(main(args.port))
+    except KeyboardInterrupt:
+        pass
@@ -1,13 +1,45 @@
+import asyncio
 import time
 from playwright.async_api import async_playwright
+from .cdp import CDPBrowser
 from .metrics import FetchResult
 from .settings import ProxySettings, ScrapeConfig
+from .url import normalize
+from .utils import looks_like_captcha
+
+# Heavy-resource URL patterns blocked inside the browser via CDP
+# Network.setBlockedURLs - no Python round-trip per request. Blocking by
+# extension rather than resource_type is a fair trade: for images, fonts,
+# and media the extensions are stable.
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm", "*.mp3", "*.ogg", "*.avi", "*.mov",
+]
+
+
+async def _route_block_heavy(route):
+    """Fallback Python-side blocking when a CDP session cannot be opened."""
+    if route.request.resource_type in {"image", "media", "font"}:
+        await route.abort()
+    else:
+        await route.continue_()
+
 
 class BrowserScraper:
     """
-    Heavyweight JS-enabled fetcher using Playwright.
+    Heavyweight JS-enabled fetcher using Playwright (or raw CDP).
 
     - Uses single browser instance per context manager (__aenter__/__aexit__)
+    - With config.browser_driver == "cdp", drives Chromium directly over the
+      DevTools protocol (see src/cdp.py) and skips Playwright entirely;
+      Playwright remains the default and the fallback
+    - Maintains a pool of pre-warmed BrowserContexts (UA/locale/proxy set
+      up once each), acquired and released around every fetch
+    - Contexts are rotated after `browser_context_max_uses` fetches to avoid
+      slow state/leak buildup; cookies are cleared between uses
+    - Pool size (= max concurrent fetches) is
+      config.max_browser_escalations_concurrent
     - Supports proxy authentication
     - Configurable headers, locale, headless mode, and heavy-resource blocking
     - Measures TTL, TTFB
@@ -19,58 +51,172 @@ class BrowserScraper:
     def __init__(self, config: ScrapeConfig ,proxy: ProxySettings | None = None):
         self.config = config
         self.proxy = proxy
-        
+
         self._playwright = None
         self._browser = None
-        self._context = None
-    
-    async def __aenter__(self):
-        self._playwright = await async_playwright().start()
+        self._cdp: CDPBrowser | None = None
+        self._sem: asyncio.Semaphore | None = None
+        self._proxy_dict = None
+        self._pool: asyncio.Queue | None = None
+        self._context_uses: dict[int, int] = {}
 
+    async def __aenter__(self):
         # Build proxy config dict if enabled
-        proxy_dict = None
         if self.proxy and self.proxy.server and self.config.use_proxy:
-            proxy_dict = {"server": self.proxy.server}
+            self._proxy_dict = {"server": self.proxy.server}
             if self.proxy.username and self.proxy.password:
-                proxy_dict["username"] = self.proxy.username
-                proxy_dict["password"] = self.proxy.password
+                self._proxy_dict["username"] = self.proxy.username
+                self._proxy_dict["password"] = self.proxy.password
 
-        # Launch browser
-        self._browser = await self._playwright.chromium.launch(
-            headless=self.config.browser_headless,
-            proxy=proxy_dict,
-        )
+        # Optional lean driver: talk CDP to Chromium directly, skipping
+        # Playwright's orchestration layer. Falls back to Playwright.
+        if self.config.browser_driver == "cdp":
+            try:
+                self._cdp = await CDPBrowser.launch(
+                    headless=self.config.browser_headless,
+                    proxy_server=self._proxy_dict["server"] if self._proxy_dict else None,
+                )
+                self._sem = asyncio.Semaphore(self.config.max_browser_escalations_concurrent)
+                return self
+            except Exception as e:
+                print(f"[browser] CDP driver unavailable ({type(e).__name__}), falling back to Playwright")
+                self._cdp = None
 
-        # Create context
-        self._context = await self._browser.new_context(
-            user_agent=self.config.user_agent,
-            locale=self.config.browser_locale,
-        )
+        self._playwright = await async_playwright().start()
 
-        # Optional: block heavy resources
-        if self.config.browser_block_heavy:
-            async def route_handler(route):
-                if route.request.resource_type in {"image", "media", "font"}:
-                    await route.abort()
-                else:
-                    await route.continue_()
-            await self._context.route("**/*", route_handler)
+        if self.config.browser_cdp_endpoint:
+            # Attach to an already-running browser (e.g. src.browser_daemon)
+            # so multiple workers share one set of Chromium subprocesses.
+            self._browser = await self._playwright.chromium.connect_over_cdp(
+                self.config.browser_cdp_endpoint
+            )
+        else:
+            # Launch browser once; per-URL isolation comes from pooled
+            # contexts, which are far cheaper than a new browser process.
+            self._browser = await self._playwright.chromium.launch(
+                headless=self.config.browser_headless,
+                proxy=self._proxy_dict,
+            )
+
+        # Pre-warm the context pool so fetches never pay context creation
+        # cost. The pool also bounds concurrency.
+        pool_size = self.config.max_browser_escalations_concurrent
+        self._pool = asyncio.Queue(maxsize=pool_size)
+        for _ in range(pool_size):
+            self._pool.put_nowait(await self._new_context())
 
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
-        if self._context:
-            await self._context.close()
+        if self._cdp:
+            await self._cdp.close()
+            self._cdp = None
+        if self._pool:
+            while not self._pool.empty():
+                ctx = self._pool.get_nowait()
+                await ctx.close()
+            self._context_uses.clear()
         if self._browser:
+            # For a connected (shared) browser this only drops our CDP
+            # connection; the daemon-owned process keeps running.
             await self._browser.close()
         if self._playwright:
             await self._playwright.stop()
 
+    async def _new_context(self):
+        """
+        Create a fresh BrowserContext with UA, locale, and proxy applied.
+        Heavy-resource blocking is installed per page (see _block_heavy).
+        """
+        ctx = await self._browser.new_context(
+            user_agent=self.config.user_agent,
+            locale=self.config.browser_locale,
+            proxy=self._proxy_dict,
+        )
+
+        self._context_uses[id(ctx)] = 0
+        return ctx
+
+    async def _block_heavy(self, page) -> None:
+        """
+        Block heavy resources for this page inside the browser. The CDP
+        path avoids the per-request Python route callback entirely; if a
+        CDP session cannot be opened (non-Chromium, remote quirks), fall
+        back to the route-handler approach.
+        """
+        try:
+            cdp = await page.context.new_cdp_session(page)
+            await cdp.send("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+            await cdp.send("Network.enable")
+        except Exception:
+            await page.route("**/*", _route_block_heavy)
+
+    async def _release_context(self, ctx) -> None:
+        """
+        Reset a context's state and return it to the pool, or replace it
+        entirely once it has served `browser_context_max_uses` fetches.
+        """
+        self._context_uses[id(ctx)] = self._context_uses.get(id(ctx), 0) + 1
+        try:
+            if self._context_uses[id(ctx)] >= self.config.browser_context_max_uses:
+                self._context_uses.pop(id(ctx), None)
+                await ctx.close()
+                ctx = await self._new_context()
+            else:
+                await ctx.clear_cookies()
+                await ctx.clear_permissions()
+        except Exception:
+            # A broken context must not shrink the pool - replace it.
+            self._context_uses.pop(id(ctx), None)
+            ctx = await self._new_context()
+        self._pool.put_nowait(ctx)
 
     async def fetch(self, url: str) -> FetchResult:
+        if self._cdp:
+            async with self._sem:
+                return await self._fetch_via_cdp(url)
+
+        ctx = await self._pool.get()
+        try:
+            return await self._fetch_in_context(ctx, url)
+        finally:
+            await self._release_context(ctx)
+
+    async def _fetch_via_cdp(self, url: str) -> FetchResult:
+        t0 = time.perf_counter()
+        try:
+            pu = normalize(url)
+        except ValueError as e:
+            return FetchResult(url=url, scraper=self.name, bytes_len=0, captcha=False, ttl_s=time.perf_counter() - t0, ttfb_s=None, error_type=type(e).__name__, status=None, domain=None, retry_count=0, parsed=None)
+        try:
+            html, status = await self._cdp.fetch_html(
+                url,
+                timeout_ms=self.config.browser_timeout_ms,
+                user_agent=self.config.user_agent,
+                blocked_urls=BLOCKED_URL_PATTERNS if self.config.browser_block_heavy else None,
+            )
+            ttl = time.perf_counter() - t0
+
+            is_captcha = looks_like_captcha(html, self.config.captcha_detection_bytes)
+            # Character count stands in for byte length; no re-encode.
+            return FetchResult(url=url, scraper=self.name, bytes_len=len(html), captcha=is_captcha, ttl_s=ttl, ttfb_s=None, error_type=None, status=status, domain=pu.registrable_domain, retry_count=0, parsed=pu)
+
+        except Exception as e:
+            ttl = time.perf_counter() - t0
+            return FetchResult(url=url, scraper=self.name, bytes_len=0, captcha=False, ttl_s=ttl, ttfb_s=None, error_type=type(e).__name__, status=None, domain=pu.registrable_domain, retry_count=0, parsed=pu)
+
+    async def _fetch_in_context(self, ctx, url: str) -> FetchResult:
         t0 = time.perf_counter()
         ttfb = None
-        page = await self._context.new_page()
+        try:
+            pu = normalize(url)
+        except ValueError as e:
+            # Malformed URL: error row, same as the transport failures below.
+            return FetchResult(url=url, scraper=self.name, bytes_len=0, captcha=False, ttl_s=time.perf_counter() - t0, ttfb_s=None, error_type=type(e).__name__, status=None, domain=None, retry_count=0, parsed=None)
+        page = await ctx.new_page()
+
+        if self.config.browser_block_heavy:
+            await self._block_heavy(page)
 
         try:
             resp = await page.goto(url, timeout=self.config.browser_timeout_ms, wait_until="domcontentloaded")
@@ -78,14 +224,18 @@ class BrowserScraper:
             html = await page.content()
             ttl = time.perf_counter() - t0
 
-            lower = html[: self.config.captcha_detection_bytes].lower()
-            is_captcha = ("captcha" in lower) or ("are you a robot" in lower)
+            is_captcha = looks_like_captcha(html, self.config.captcha_detection_bytes)
             status = resp.status if resp else 200
-            return FetchResult(url=url, scraper=self.name, bytes_len=len(html.encode("utf-8","ignore")), captcha=is_captcha, ttl_s=ttl, ttfb_s=ttfb, error_type=None, status=status, retry_count=0)
-        
+
+            # Character count stands in for byte length; no re-encode. The
+            # document's Content-Length would report the compressed transfer
+            # size, which is not comparable with the HTTP scraper's counts.
+            bytes_len = len(html)
+            return FetchResult(url=url, scraper=self.name, bytes_len=bytes_len, captcha=is_captcha, ttl_s=ttl, ttfb_s=ttfb, error_type=None, status=status, domain=pu.registrable_domain, retry_count=0, parsed=pu)
+
         except Exception as e:
             ttl = time.perf_counter() - t0
-            return FetchResult(url=url, scraper=self.name, bytes_len=0, captcha=False, ttl_s=ttl, ttfb_s=ttfb, error_type=type(e).__name__, status=None, retry_count=0)
-        
+            return FetchResult(url=url, scraper=self.name, bytes_len=0, captcha=False, ttl_s=ttl, ttfb_s=ttfb, error_type=type(e).__name__, status=None, domain=pu.registrable_domain, retry_count=0, parsed=pu)
+
         finally:
             await page.close()
@@ -0,0 +1,249 @@
+"""
+Minimal Chrome DevTools Protocol (CDP) client.
+
+Drives a headless Chromium directly over one WebSocket instead of going
+through the full Playwright orchestration layer. For the simple
+"goto + read content" workload this skips Playwright's per-action state
+synchronization: each command is a single JSON round-trip.
+
+Used by BrowserScraper when `config.browser_driver == "cdp"`; Playwright
+remains the default driver and the fallback.
+"""
+
+import asyncio
+import itertools
+import re
+import subprocess
+import tempfile
+
+import aiohttp
+
+_WS_ENDPOINT_RE = re.compile(r"DevTools listening on (ws://\S+)")
+
+
+def _chromium_executable() -> str:
+    """
+    Locate the Chromium binary from the Playwright installation, so the
+    CDP driver needs no extra browser download. Runs in a thread because
+    sync_playwright spawns a short-lived driver process.
+    """
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as p:
+        return p.chromium.executable_path
+
+
+class CDPSession:
+    """
+    A flattened CDP session bound to one target (page). Commands carry the
+    sessionId; events for the target are routed back here by CDPBrowser.
+    """
+
+    def __init__(self, browser: "CDPBrowser", session_id: str, target_id: str):
+        self._browser = browser
+        self.session_id = session_id
+        self.target_id = target_id
+        self._events: dict[str, asyncio.Future] = {}
+
+    async def send(self, method: str, params: dict | None = None) -> dict:
+        return await self._browser._send(method, params, session_id=self.session_id)
+
+    def wait_for_event(self, name: str) -> asyncio.Future:
+        """Future resolved with the event params the next time `name` fires."""
+        fut = self._events.get(name)
+        if fut is None or fut.done():
+            fut = asyncio.get_running_loop().create_future()
+            self._events[name] = fut
+        return fut
+
+    def _dispatch_event(self, name: str, params: dict) -> None:
+        fut = self._events.get(name)
+        if fut is not None and not fut.done():
+            fut.set_result(params)
+
+
+class CDPBrowser:
+    """
+    One headless Chromium process plus one multiplexed CDP WebSocket.
+
+    - Commands are matched to responses via an incrementing id -> Future map
+    - Targets are attached with flatten=True so all traffic shares the socket
+    - `fetch_html` is the whole public surface: navigate and read the DOM
+    """
+
+    def __init__(self):
+        self._proc: subprocess.Popen | None = None
+        self._http: aiohttp.ClientSession | None = None
+        self._ws: aiohttp.ClientWebSocketResponse | None = None
+        self._reader_task: asyncio.Task | None = None
+        self._ids = itertools.count(1)
+        self._pending: dict[int, asyncio.Future] = {}
+        self._sessions: dict[str, CDPSession] = {}
+        self._user_data_dir: tempfile.TemporaryDirectory | None = None
+
+    @classmethod
+    async def launch(cls, headless: bool = True, proxy_server: str | None = None) -> "CDPBrowser":
+        """
+        Launch Chromium with --remote-debugging-port=0, read the ws endpoint
+        from stderr, and connect a single WebSocket to it.
+        """
+        self = cls()
+        executable = await asyncio.to_thread(_chromium_executable)
+
+        self._user_data_dir = tempfile.TemporaryDirectory(prefix="cdp-profile-")
+        args = [
+            executable,
+            "--remote-debugging-port=0",
+            f"--user-data-dir={self._user_data_dir.name}",
+            "--no-first-run",
+            "--no-default-browser-check",
+            "--disable-background-networking",
+        ]
+        if headless:
+            args.append("--headless=new")
+        if proxy_server:
+            args.append(f"--proxy-server={proxy_server}")
+
+        self._proc = subprocess.Popen(
+            args, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+        )
+
+        try:
+            ws_url = await asyncio.wait_for(
+                asyncio.to_thread(self._read_ws_endpoint), timeout=30.0
+            )
+        except asyncio.TimeoutError:
+            # Kill the process so the blocked stderr read unwinds, and raise
+            # instead of hanging - BrowserScraper catches this and falls back
+            # to the Playwright driver.
+            self._proc.kill()
+            self._user_data_dir.cleanup()
+            raise RuntimeError("Chromium did not announce a DevTools endpoint within 30s")
+        self._http = aiohttp.ClientSession()
+        self._ws = await self._http.ws_connect(ws_url, max_msg_size=0)
+        self._reader_task = asyncio.create_task(self._reader())
+        return self
+
+    def _read_ws_endpoint(self) -> str:
+        """Blocking scan of Chromium stderr for the DevTools ws URL."""
+        for line in self._proc.stderr:
+            m = _WS_ENDPOINT_RE.search(line)
+            if m:
+                return m.group(1)
+        raise RuntimeError("Chromium exited before announcing a DevTools endpoint")
+
+    async def _reader(self) -> None:
+        """Route responses to pending futures and events to their sessions."""
+        import json
+
+        async for msg in self._ws:
+            if msg.type != aiohttp.WSMsgType.TEXT:
+                break
+            data = json.loads(msg.data)
+
+            if "id" in data:
+                fut = self._pending.pop(data["id"], None)
+                if fut is None or fut.done():
+                    continue
+                if "error" in data:
+                    fut.set_exception(
+                        RuntimeError(f"CDP error: {data['error'].get('message')}")
+                    )
+                else:
+                    fut.set_result(data.get("result", {}))
+            else:
+                session = self._sessions.get(data.get("sessionId", ""))
+                if session is not None:
+                    session._dispatch_event(data.get("method", ""), data.get("params", {}))
+
+        # Socket closed - fail anything still in flight
+        for fut in self._pending.values():
+            if not fut.done():
+                fut.set_exception(ConnectionError("CDP WebSocket closed"))
+        self._pending.clear()
+
+    async def _send(self, method: str, params: dict | None = None, session_id: str | None = None) -> dict:
+        import json
+
+        msg_id = next(self._ids)
+        payload: dict = {"id": msg_id, "method": method, "params": params or {}}
+        if session_id:
+            payload["sessionId"] = session_id
+
+        fut = asyncio.get_running_loop().create_future()
+        self._pending[msg_id] = fut
+        await self._ws.send_str(json.dumps(payload))
+        return await fut
+
+    async def new_session(self) -> CDPSession:
+        """Create a blank target and attach to it in flattened mode."""
+        created = await self._send("Target.createTarget", {"url": "about:blank"})
+        target_id = created["targetId"]
+        attached = await self._send(
+            "Target.attachToTarget", {"targetId": target_id, "flatten": True}
+        )
+        session = CDPSession(self, attached["sessionId"], target_id)
+        self._sessions[session.session_id] = session
+        await session.send("Page.enable")
+        return session
+
+    async def close_session(self, session: CDPSession) -> None:
+        self._sessions.pop(session.session_id, None)
+        try:
+            await self._send("Target.closeTarget", {"targetId": session.target_id})
+        except Exception:
+            pass
+
+    async def fetch_html(
+        self,
+        url: str,
+        timeout_ms: int,
+        user_agent: str | None = None,
+        blocked_urls: list[str] | None = None,
+    ) -> tuple[str, int]:
+        """
+        Navigate a fresh target to `url`, wait for DOMContentLoaded, and
+        return (outerHTML, status). Raises on navigation errors/timeouts.
+        `blocked_urls` patterns are blocked in-browser (Network.setBlockedURLs).
+        """
+        session = await self.new_session()
+        try:
+            if user_agent or blocked_urls:
+                await session.send("Network.enable")
+            if user_agent:
+                await session.send("Network.setUserAgentOverride", {"userAgent": user_agent})
+            if blocked_urls:
+                await session.send("Network.setBlockedURLs", {"urls": blocked_urls})
+
+            dom_loaded = session.wait_for_event("Page.domContentEventFired")
+            nav = await session.send("Page.navigate", {"url": url})
+            if nav.get("errorText"):
+                raise RuntimeError(f"Navigation failed: {nav['errorText']}")
+
+            await asyncio.wait_for(dom_loaded, timeout=timeout_ms / 1000)
+
+            result = await session.send(
+                "Runtime.evaluate",
+                {"expression": "document.documentElement.outerHTML", "returnByValue": True},
+            )
+            html = result.get("result", {}).get("value", "") or ""
+            # CDP's navigate result has no status; treat a rendered DOM as 200.
+            return html, 200
+        finally:
+            await self.close_session(session)
+
+    async def close(self) -> None:
+        if self._reader_task:
+            self._reader_task.cancel()
+        if self._ws:
+            await self._ws.close()
+        if self._http:
+            await self._http.close()
+        if self._proc:
+            self._proc.terminate()
+            try:
+                await asyncio.to_thread(self._proc.wait, 10)
+            except Exception:
+                self._proc.kill()
+        if self._user_data_dir:
+            self._user_data_dir.cleanup()
@@ -1,6 +1,9 @@
 import time, aiohttp
+from .host_limiter import HostLimiter
 from .metrics import FetchResult
 from .settings import ScrapeConfig, ProxySettings
+from .url import normalize
+from .utils import looks_like_captcha
 
 
 DEFAULT_HTTP_HEADERS = {
@@ -16,6 +19,7 @@ class HttpScraper:
 
     - Supports proxy usage
     - Controlled by ScrapeConfig (timeouts, UA, retries are handled outside)
+    - Per-host in-flight and rate caps via HostLimiter
     - Measures TTL, TTFB
     - Detects CAPTCHA heuristically using the first bytes of HTML
     """
@@ -25,6 +29,7 @@ class HttpScraper:
         self.session = session
         self.config = config
         self.proxy = proxy
+        self.limiter = HostLimiter.from_config(config)
 
     async def fetch(self, url: str) -> FetchResult:
         """
@@ -41,18 +46,38 @@ class HttpScraper:
         headers = {**DEFAULT_HTTP_HEADERS, "User-Agent": self.config.user_agent}
 
         try:
-            async with self.session.get(
+            pu = normalize(url)
+        except ValueError as e:
+            # Malformed URL (e.g. a bad IPv6 netloc): report it as an error
+            # row like any other failure instead of aborting the batch.
+            return FetchResult(url=url, scraper=self.name, bytes_len=0, captcha=False, ttl_s=time.perf_counter() - t0, ttfb_s=None, error_type=type(e).__name__, status=None, domain=None, retry_count=0, parsed=None)
+
+        try:
+            async with self.limiter.slot(pu.host), self.session.get(
                 url, proxy=proxy_url, headers = headers,
                 timeout=self.config.http_total_timeout_s, allow_redirects = True
             ) as resp:
                 ttfb = time.perf_counter() - t0
-                body = await resp.read()
+
+                # Stream instead of resp.read(): memory stays O(chunk) and
+                # we keep only the head needed for CAPTCHA detection, plus
+                # a running byte count. Oversized bodies are cut short.
+                head = bytearray()
+                head_limit = self.config.captcha_detection_bytes
+                total = 0
+                truncated = False
+                async for chunk in resp.content.iter_chunked(16384):
+                    total += len(chunk)
+                    if len(head) < head_limit:
+                        head.extend(chunk)
+                    if total > self.config.http_max_body_bytes:
+                        truncated = True
+                        break
                 ttl = time.perf_counter() - t0
 
-                lower = body[: self.config.captcha_detection_bytes].lower()
-                is_captcha = (b"captcha" in lower) or (b"are you a robot" in lower)
+                is_captcha = looks_like_captcha(bytes(head), head_limit)
 
-                return FetchResult(url=url, scraper=self.name, bytes_len=len(body), captcha=is_captcha, ttl_s=ttl, ttfb_s=ttfb, error_type=None, status=resp.status, retry_count=0)
+                return FetchResult(url=url, scraper=self.name, bytes_len=total, captcha=is_captcha, ttl_s=ttl, ttfb_s=ttfb, error_type="body_too_large" if truncated else None, status=resp.status, domain=pu.registrable_domain, retry_count=0, parsed=pu)
         except Exception as e:
             ttl = time.perf_counter() - t0
-            return FetchResult(url=url, scraper=self.name, bytes_len=0, captcha=False, ttl_s=ttl, ttfb_s=ttfb, error_type=type(e).__name__, status=None, retry_count=0)
+            return FetchResult(url=url, scraper=self.name, bytes_len=0, captcha=False, ttl_s=ttl, ttfb_s=ttfb, error_type=type(e).__name__, status=None, domain=pu.registrable_domain, retry_count=0, parsed=pu)
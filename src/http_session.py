@@ -0,0 +1,94 @@
+"""
+Shared aiohttp session construction.
+
+All HTTP traffic (HttpScraper fetches and RobotsCache lookups) should go
+through ONE ClientSession so the TCP+TLS connection pool and DNS cache
+are actually reused. Building a session per request (or per component)
+silently throws that away and re-handshakes every host.
+"""
+
+import asyncio
+import socket
+from typing import Iterable
+
+import aiohttp
+
+from .settings import ScrapeConfig
+
+try:
+    import aiodns  # noqa: F401  (aiohttp's AsyncResolver needs it)
+    _HAVE_AIODNS = True
+except ImportError:
+    _HAVE_AIODNS = False
+
+
+def build_session(config: ScrapeConfig) -> aiohttp.ClientSession:
+    """
+    Build the app-wide ClientSession with a tuned TCPConnector.
+
+    Construct once per run and inject into both HttpScraper and
+    RobotsCache; close it when the run is done (`async with` works too).
+
+    Tuning rationale:
+    - limit / limit_per_host sized from http_concurrency so the connector
+      never becomes a hidden bottleneck below our own semaphore
+    - ttl_dns_cache avoids re-resolving hot hosts
+    - keepalive_timeout keeps connections warm across a batch
+    - enable_cleanup_closed prevents slow leak of half-closed SSL transports
+    """
+    # c-ares-backed resolver when aiodns is installed: lookups don't tie up
+    # the loop's default thread pool the way getaddrinfo does.
+    resolver = aiohttp.AsyncResolver() if _HAVE_AIODNS else None
+    connector = aiohttp.TCPConnector(
+        limit=config.http_concurrency * 2,
+        limit_per_host=config.http_limit_per_host,
+        ttl_dns_cache=config.http_dns_cache_ttl_s,
+        keepalive_timeout=75,
+        enable_cleanup_closed=True,
+        resolver=resolver,
+    )
+    timeout = aiohttp.ClientTimeout(
+        total=config.http_total_timeout_s,
+        connect=config.http_connect_timeout_s,
+        sock_read=config.http_sock_read_timeout_s,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=timeout,
+        auto_decompress=True,
+    )
+
+
+async def prewarm_dns(urls: Iterable[str], concurrency: int = 50) -> None:
+    """
+    Resolve every unique host in `urls` before the fetch fan-out, so
+    getaddrinfo latency is paid upfront (and cached by the OS / stub
+    resolver) instead of inside the latency-critical request path.
+
+    Failures are ignored: a host that doesn't resolve here will surface
+    as a normal connect error during the fetch itself.
+    """
+    from urllib.parse import urlsplit
+
+    # .hostname (not netloc) strips userinfo and brackets/ports correctly,
+    # including IPv6 literals like [::1]:8080. URLs that don't parse are
+    # skipped - like resolution failures, they surface per-URL later.
+    def _host(u: str) -> str | None:
+        try:
+            return urlsplit(u).hostname
+        except ValueError:
+            return None
+
+    hosts = {h for h in map(_host, urls) if h}
+
+    loop = asyncio.get_running_loop()
+    sem = asyncio.Semaphore(concurrency)
+
+    async def resolve(host: str) -> None:
+        async with sem:
+            try:
+                await loop.getaddrinfo(host, 443, type=socket.SOCK_STREAM)
+            except OSError:
+                pass
+
+    await asyncio.gather(*(resolve(h) for h in hosts))
@@ -1,10 +1,16 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 
-@dataclass
+from .url import ParsedURL
+
+@dataclass(slots=True)
 class FetchResult:
     """
     Normalized per-URL result used by both HTTP and browser scrapers.
 
+    Declared with slots: instances are created once per URL and can be
+    retained by the hundred-thousand per run, so skipping the per-instance
+    __dict__ is a real memory win (and attribute access gets faster).
+
     Fields:
         url         : The URL that was requested.
         scraper     : Name of the scraper, e.g. "http" or "browser".
@@ -15,9 +21,13 @@ class FetchResult:
         error_type  : String name of the error/exception (e.g. "TimeoutError"),
                       or "robots_blocked" when filtered before request.
         status      : HTTP status code if available (e.g. 200, 404).
-        domain      : Normalized registrable domain (filled in later).
+        domain      : Normalized registrable domain (from `parsed`,
+                      filled at construction by the scrapers).
         proxy_hint  : "proxy" vs "direct" - how this request was routed.
         retry_count : Number of retries attempted for this URL (HTTP only).
+        parsed      : ParsedURL carried through the pipeline so consumers
+                      never re-parse the URL string (not exported to
+                      DataFrames - `url`/`domain` columns cover it).
     """
     url: str
     scraper: str
@@ -30,3 +40,59 @@ class FetchResult:
     domain: str | None = None
     proxy_hint: str | None = None
     retry_count: int = 0
+    parsed: ParsedURL | None = None
+
+
+_RESULT_FIELDS = tuple(f.name for f in fields(FetchResult) if f.name != "parsed")
+
+# Columns that benefit from a typed numpy array at DataFrame construction
+# (everything else may contain None and stays an object column).
+_TYPED_COLUMNS = {
+    "bytes_len": "int64",
+    "captcha": "bool",
+    "ttl_s": "float64",
+    "retry_count": "int64",
+}
+
+
+class ResultSink:
+    """
+    Columnar accumulator for FetchResults (SoA instead of list-of-objects).
+
+    Appending into parallel per-field lists as results arrive avoids the
+    per-row asdict() dict allocation when building the final DataFrame:
+    to_df() hands pandas ready-made columns, with the numeric ones already
+    materialized as typed numpy arrays.
+    """
+
+    def __init__(self):
+        self._columns: dict[str, list] = {name: [] for name in _RESULT_FIELDS}
+
+    def __len__(self) -> int:
+        return len(self._columns["url"])
+
+    def add(self, r: FetchResult) -> None:
+        for name, column in self._columns.items():
+            column.append(getattr(r, name))
+
+    def to_pydict(self) -> dict[str, list]:
+        """The accumulated columns, e.g. for pyarrow.Table.from_pydict."""
+        return self._columns
+
+    def clear(self) -> None:
+        self._columns = {name: [] for name in _RESULT_FIELDS}
+
+    def to_df(self):
+        """Build a pandas DataFrame once, from the accumulated columns."""
+        import numpy as np
+        import pandas as pd
+
+        if not len(self):
+            return pd.DataFrame()
+
+        data = {
+            name: np.asarray(column, dtype=_TYPED_COLUMNS[name])
+            if name in _TYPED_COLUMNS else column
+            for name, column in self._columns.items()
+        }
+        return pd.DataFrame(data)
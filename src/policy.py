@@ -9,24 +9,22 @@ The logic is:
 """
 
 from src.metrics import FetchResult
-from src.settings import ScrapeConfig
+from src.settings import ScrapeConfig, DEFAULT_SCRAPE_CONFIG
 
 
 def should_escalate(r: FetchResult, config: ScrapeConfig | None = None) -> bool:
-    # We only import here to avoid circular dependency
-    from src.settings import DEFAULT_SCRAPE_CONFIG
+    # Runs once per fetched result, so keep it tight: hard negatives first
+    # (robots/captcha also mask the error branch below), then the positive
+    # signals ordered by how often they fire in practice.
     cfg = config or DEFAULT_SCRAPE_CONFIG
-    
-    if r.error_type == "robots_blocked":
-        return False
 
-    if r.captcha:
+    if r.error_type == "robots_blocked" or r.captcha:
         return False
 
-    if r.error_type is not None:
+    if r.status is not None and r.status >= 400:
         return True
 
-    if r.status is not None and r.status >= 400:
+    if r.error_type is not None:
         return True
 
     # Tiny pages (might be partial, JS-reliant, or error stubs)
@@ -36,5 +34,5 @@ def should_escalate(r: FetchResult, config: ScrapeConfig | None = None) -> bool:
     # Optionally (if enabled) treat very slow HTTP responses as candidates for browser escalation
     if cfg.escalation_consider_latency and r.ttl_s > cfg.escalation_latency_s:
         return True
-    
+
     return False
@@ -1,7 +1,36 @@
+import asyncio
+import functools
+import os
+import re
+import threading
 import time
 from urllib.parse import urlparse
 import aiohttp
+import orjson
 from .settings import ScrapeConfig, PROJECT_ROOT
+from .url import ParsedURL
+
+# Pulls (user-agent|disallow, value) pairs out of a robots.txt in one C-level
+# pass, replacing the per-line strip/lower/startswith Python loop.
+_ROBOTS_RE = re.compile(r"^\s*(user-agent|disallow)\s*:\s*([^\s#]*)", re.IGNORECASE | re.MULTILINE)
+
+# Fast path for well-formed absolute URLs; urlparse is pure Python and
+# costs a few microseconds per call, which adds up across a big URL set.
+_ORIGIN_FAST_RE = re.compile(r"^([A-Za-z][A-Za-z0-9+.-]*)://([^/?#]+)")
+
+
+@functools.lru_cache(maxsize=65536)
+def _origin_from_url(url: str) -> str:
+    """
+    Normalize a URL to its origin (scheme://host), memoized so repeat URLs
+    (and robots checks per batch) cost a hash lookup after the first time.
+    """
+    m = _ORIGIN_FAST_RE.match(url)
+    if m:
+        return f"{m.group(1)}://{m.group(2)}"
+    parsed = urlparse(url)
+    scheme = parsed.scheme or "https"
+    return f"{scheme}://{parsed.netloc}"
 
 
 class RobotsCache:
@@ -15,7 +44,10 @@ class RobotsCache:
     Behavior:
     - If robots.txt is unreachable or malformed - allow (and cache)
     - Cache entries expire every `ttl_s` seconds
-    - Cached on disk at `config.robots_cache_path`
+    - Cached on disk at `config.robots_cache_path` as append-only JSONL:
+      each decision is one orjson line, so a store is O(1) instead of a
+      full-file rewrite; on load, the last line per origin wins
+    - `close()` compacts the log back to one line per origin (atomic rename)
     """
 
     def __init__(
@@ -28,18 +60,24 @@ class RobotsCache:
         self.cache_path = (PROJECT_ROOT / config.robots_cache_path).resolve()
         self.ttl_s = config.robots_cache_ttl_s
         self._cache: dict[str, dict] = {}
+        # Guards _cache and the log handle: decisions are stored from a
+        # worker thread (asyncio.to_thread) so disk appends never block
+        # the event loop.
+        self._lock = threading.Lock()
+        self._log_fh = None
         self._load_cache()
 
 
-    async def allowed(self, url: str) -> bool:
+    async def allowed(self, url: "str | ParsedURL") -> bool:
         """
         Returns True if allowed to fetch this URL according to robots.txt.
+        Accepts a raw URL string or an already-normalized ParsedURL.
         Uses:
             - cached decision (if fresh)
             - fallback if robots.txt cannot be fetched
         """
 
-        origin = self._origin_from_url(url)
+        origin = url.origin if isinstance(url, ParsedURL) else self._origin_from_url(url)
 
         cached = self._get_cached(origin)
         if cached is not None:
@@ -52,16 +90,16 @@ class RobotsCache:
             text = await self._fetch_robots(robots_url)
         except Exception:
             # If robots retrieval fails, be permissive but cache the decision
-            self._store(origin, True)
+            await asyncio.to_thread(self._store, origin, True)
             return True
 
         if text is None:
             # No robots.txt - allow
-            self._store(origin, True)
+            await asyncio.to_thread(self._store, origin, True)
             return True
 
         allowed = self._parse_robots(text, self.user_agent)
-        self._store(origin, allowed)
+        await asyncio.to_thread(self._store, origin, allowed)
         return allowed
 
 
@@ -69,16 +107,14 @@ class RobotsCache:
         """
         Normalize a URL to its origin: scheme://host
         """
-        parsed = urlparse(url)
-        scheme = parsed.scheme or "https"
-        host = parsed.netloc
-        return f"{scheme}://{host}"
+        return _origin_from_url(url)
 
     def _get_cached(self, origin: str) -> bool | None:
         """
         Returns None if not cached or expired, otherwise returns allowed/disallowed
         """
-        entry = self._cache.get(origin)
+        with self._lock:
+            entry = self._cache.get(origin)
         if not entry:
             return None
         ts = entry.get("ts")
@@ -89,10 +125,12 @@ class RobotsCache:
 
     def _store(self, origin: str, allowed: bool) -> None:
         """
-        Store the robots decision in memory and persist to disk
+        Store the robots decision in memory and append it to the on-disk log
         """
-        self._cache[origin] = {"allowed": bool(allowed), "ts": time.time()}
-        self._save_cache()
+        entry = {"allowed": bool(allowed), "ts": time.time()}
+        with self._lock:
+            self._cache[origin] = entry
+            self._append_entry(origin, entry)
 
     async def _fetch_robots(self, robots_url: str) -> str | None:
         """
@@ -116,19 +154,16 @@ class RobotsCache:
         - If that block has 'Disallow: /' - deny
         - Everything else (including Disallow of partial paths) - allow
         """
-        lines = [ln.strip() for ln in content.splitlines()]
         ua = user_agent.lower()
         active_block = None   # None / "us" / "star"
 
         allowed = True  # default allow
 
-        for ln in lines:
-            if not ln or ln.startswith("#"):
-                continue
+        for m in _ROBOTS_RE.finditer(content):
+            key = m.group(1).lower()
+            value = m.group(2).lower()
 
-            lower = ln.lower()
-            if lower.startswith("user-agent:"):
-                value = lower.split(":", 1)[1].strip()
+            if key == "user-agent":
                 if value == "*":
                     active_block = "star"
                 elif value in ua:
@@ -137,10 +172,9 @@ class RobotsCache:
                     active_block = None
                 continue
 
-            if lower.startswith("disallow:") and active_block in {"star", "us"}:
-                rule = lower.split(":", 1)[1].strip()
-                if rule == "/" or rule == "/*":
-                    allowed = False
+            # key == "disallow"
+            if active_block in {"star", "us"} and value in {"/", "/*"}:
+                allowed = False
 
         return allowed
 
@@ -148,31 +182,97 @@ class RobotsCache:
     def _load_cache(self) -> None:
         """
         Load robots decisions from disk.
+
+        Understands both the JSONL log (one {"origin", "allowed", "ts"}
+        object per line, last line per origin wins) and the legacy format
+        (one big JSON dict), which gets compacted on the next close().
         """
         if not self.cache_path.exists():
             return
         try:
-            import json
-
-            raw = self.cache_path.read_text(encoding="utf-8")
-            data = json.loads(raw)
-            if isinstance(data, dict):
-                self._cache = data
+            raw = self.cache_path.read_bytes()
+            if self._looks_like_jsonl(raw):
+                for line in raw.splitlines():
+                    if not line.strip():
+                        continue
+                    entry = orjson.loads(line)
+                    origin = entry.pop("origin", None)
+                    if origin:
+                        self._cache[origin] = entry
+            else:
+                # Legacy: whole cache as a single JSON dict
+                data = orjson.loads(raw)
+                if isinstance(data, dict):
+                    self._cache = data
         except Exception:
             self._cache = {}
 
-    def _save_cache(self) -> None:
+    @staticmethod
+    def _looks_like_jsonl(raw: bytes) -> bool:
+        """
+        JSONL log lines are self-contained objects tagged with "origin";
+        the legacy format is one indented JSON dict keyed by origin.
+        """
+        first_line = raw.split(b"\n", 1)[0]
+        try:
+            entry = orjson.loads(first_line)
+        except Exception:
+            return False
+        return isinstance(entry, dict) and "origin" in entry
+
+    def _append_entry(self, origin: str, entry: dict) -> None:
         """
-        Persist robots decisions to disk.
+        Append one decision to the on-disk log: O(1) per store, no rewrite.
         """
         try:
-            import json
+            if self._log_fh is None:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                # Legacy dict-format files can't be appended to - start over
+                # from the in-memory cache (already loaded from them).
+                mode = "wb" if self._is_legacy_file() else "ab"
+                self._log_fh = open(self.cache_path, mode)
+                if mode == "wb":
+                    for known_origin, known_entry in self._cache.items():
+                        if known_origin != origin:
+                            self._log_fh.write(orjson.dumps({"origin": known_origin, **known_entry}) + b"\n")
+            self._log_fh.write(orjson.dumps({"origin": origin, **entry}) + b"\n")
+            self._log_fh.flush()
+        except Exception:
+            # Don't crash scraping due to cache save failure
+            pass
+
+    def _is_legacy_file(self) -> bool:
+        try:
+            with open(self.cache_path, "rb") as fh:
+                return not self._looks_like_jsonl(fh.readline())
+        except OSError:
+            return False
+
+    async def __aenter__(self) -> "RobotsCache":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        # close() does blocking file IO (compaction rewrite); keep it off
+        # the event loop like the _store calls above.
+        await asyncio.to_thread(self.close)
 
+    def close(self) -> None:
+        """
+        Compact the append-only log to one line per origin and close the
+        file handle. Uses write-to-temp + atomic rename.
+        """
+        try:
+            with self._lock:
+                if self._log_fh is not None:
+                    self._log_fh.close()
+                    self._log_fh = None
+                snapshot = dict(self._cache)
             self.cache_path.parent.mkdir(parents=True, exist_ok=True)
-            self.cache_path.write_text(
-                json.dumps(self._cache, ensure_ascii=False, indent=2),
-                encoding="utf-8",
-            )
+            tmp_path = self.cache_path.with_suffix(self.cache_path.suffix + ".tmp")
+            with open(tmp_path, "wb") as fh:
+                for origin, entry in snapshot.items():
+                    fh.write(orjson.dumps({"origin": origin, **entry}) + b"\n")
+            os.replace(tmp_path, self.cache_path)
         except Exception:
             # Don't crash scraping due to cache save failure
             pass
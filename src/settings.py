@@ -1,21 +1,33 @@
+from functools import cached_property, lru_cache
 from pathlib import Path
 from urllib.parse import urlparse
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from dataclasses import dataclass, fields
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml, C speed
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 
 class ProxySettings(BaseModel):
+    # Frozen so the cached url below can never go stale.
+    model_config = ConfigDict(frozen=True)
+
     server: str | None = None
     username: str | None = None
     password: str | None = None
 
-    @property
+    @cached_property
     def url(self) -> str | None:
         """
         Full proxy URL with credentials if available, otherwise bare server.
 
+        Computed once per instance (HttpScraper reads this on every
+        request, and the parts never change on a frozen model).
+
         For aiohttp:
             proxy=self.url
 
@@ -83,9 +95,15 @@ class ScrapeConfig:
 
     # HTTP client tuning
     http_concurrency: int = 20
+    http_limit_per_host: int = 8
+    http_dns_cache_ttl_s: int = 300
+    http_per_host_concurrency: int = 4  # in-flight requests per host
+    http_per_host_rps: float = 0.0      # request rate per host (0 = unlimited)
+    http_prewarm_dns: bool = True       # resolve unique hosts before the fetch fan-out
     http_total_timeout_s: float = 20.0
     http_connect_timeout_s: float = 10.0
     http_sock_read_timeout_s: float = 15.0
+    http_max_body_bytes: int = 10 * 1024 * 1024  # stop streaming past this ("body_too_large")
     
     # HTTP retries
     http_max_retries: int = 1 
@@ -93,14 +111,18 @@ class ScrapeConfig:
     http_retry_jitter_s: float = 0.2
 
     # Browser tuning
+    browser_driver: str = "playwright"  # "playwright" or "cdp" (lean direct-CDP driver)
+    browser_cdp_endpoint: str | None = None  # attach to a shared browser (src.browser_daemon)
     browser_timeout_ms: int = 20_000
     browser_headless: bool = True
     browser_block_heavy: bool = True
     max_browser_escalations: int = 100  # cap escalated URLs per run
+    max_browser_escalations_concurrent: int = 4  # parallel contexts on one browser
+    browser_context_max_uses: int = 25  # rotate pooled contexts after this many fetches
     browser_locale: str = "en-US"
 
     # Robotos cache
-    robots_cache_path: str = "data/robots_cache.json"
+    robots_cache_path: str = "data/robots_cache.jsonl"
     robots_cache_ttl_s: int = 24 * 3600
 
     # Escalation tuning
@@ -108,11 +130,15 @@ class ScrapeConfig:
     escalation_consider_latency: bool = False
     escalation_latency_s: float = 5.0
 
+@lru_cache(maxsize=None)
 def load_scrape_config(path: str | Path | None = None) -> ScrapeConfig:
     """
     Load ScrapeConfig from YAML if present; otherwise use defaults.
 
     By default, looks for `scrape_config.yaml` at the project root.
+    Parsed with libyaml's C loader when available (pure-Python PyYAML is
+    noticeably slower), and memoized per path so repeated imports/tests
+    don't re-read the file.
     """
 
     if path is None:
@@ -123,11 +149,10 @@ def load_scrape_config(path: str | Path | None = None) -> ScrapeConfig:
     path = Path(path)
 
     if not path.exists():
-        print(f"[config] YAML not found at {path}, using defaults")
-        return ScrapeConfig()  # fallback
-    
+        return ScrapeConfig()  # fallback to defaults
+
     raw = path.read_text(encoding="utf-8")
-    data = yaml.safe_load(raw) or {}
+    data = yaml.load(raw, Loader=_YamlLoader) or {}
 
     if not isinstance(data, dict):
         print(f"[config] Expected mapping in {path}, got {type(data)}, using defaults")
@@ -1,19 +1,151 @@
-import pandas as pd
+import asyncio
+
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+from .metrics import FetchResult, ResultSink
 from .settings import PROJECT_ROOT
 
+# No pandas at module level on purpose: its ~300ms import and pure-Python
+# CSV writer stay out of the storage path. Arrow's C++ writers handle
+# serialization; pandas DataFrames are accepted as input via from_pandas
+# (pandas is then already imported by the caller).
+
 RESULTS_DIR = PROJECT_ROOT / "results"
 
-def save_df(df: pd.DataFrame, name: str) -> None:
+# Arrow schema for streamed FetchResult batches (ResultWriter below).
+# Mirrors the _DOWNCAST choices used for the end-of-run artifacts.
+_RESULT_SCHEMA = pa.schema([
+    ("url", pa.string()),
+    ("scraper", pa.string()),
+    ("bytes_len", pa.int32()),
+    ("captcha", pa.bool_()),
+    ("ttl_s", pa.float32()),
+    ("ttfb_s", pa.float32()),
+    ("error_type", pa.string()),
+    ("status", pa.int32()),
+    ("domain", pa.string()),
+    ("proxy_hint", pa.string()),
+    ("retry_count", pa.int32()),
+])
+
+# Columns worth narrowing before writing: types survive in Parquet, so the
+# downcast pays off in file size and read bandwidth (unlike CSV, where
+# everything is stringified anyway). All Arrow types are nullable, so
+# e.g. status being missing on transport errors needs no special case.
+_DOWNCAST = {
+    "bytes_len": pa.int32(),
+    "status": pa.int32(),
+    "retry_count": pa.int32(),
+    "captcha": pa.bool_(),
+    "ttl_s": pa.float32(),
+    "ttfb_s": pa.float32(),
+}
+
+
+def _to_table(data) -> pa.Table:
+    """
+    Build an Arrow table from whatever the caller accumulated: a
+    ResultSink, a plain dict of columns, or a pandas DataFrame.
     """
-    Persist a DataFrame as CSV under results/<name>.csv.
+    if isinstance(data, ResultSink):
+        return pa.Table.from_pydict(data.to_pydict())
+    if isinstance(data, dict):
+        return pa.Table.from_pydict(data)
+    return pa.Table.from_pandas(data, preserve_index=False)
+
+
+def save_df(df, name: str, format: str = "parquet") -> None:
+    """
+    Persist results under results/<name>.parquet (zstd-compressed) or
+    results/<name>.csv with format="csv", written by Arrow's C++
+    serializers rather than pandas'. Accepts a pandas DataFrame, a
+    ResultSink, or a dict of columns.
 
     This intentionally keeps the storage layer minimal, but centralizes
     the filesystem layout so it can be replaced later (e.g., S3, DB, etc.).
     """
-    if df.empty:
+    table = _to_table(df)
+    if table.num_rows == 0:
         return
-    
+
+    table = table.cast(pa.schema(
+        [pa.field(f.name, _DOWNCAST.get(f.name, f.type)) for f in table.schema]
+    ))
+
     RESULTS_DIR.mkdir(parents=True, exist_ok=True)
-    out_path = RESULTS_DIR / f"{name}.csv"
-    df.to_csv(out_path, index=False)
+
+    if format == "csv":
+        out_path = RESULTS_DIR / f"{name}.csv"
+        pacsv.write_csv(table, out_path)
+    else:
+        out_path = RESULTS_DIR / f"{name}.parquet"
+        pq.write_table(table, out_path, compression="zstd")
+
     print(f"Saved {out_path}")
+
+
+class ResultWriter:
+    """
+    Streams FetchResults to results/<name>.parquet while scraping runs.
+
+    Producers `await put(r)` as results complete; a background task drains
+    the queue and appends zstd-compressed row groups via ParquetWriter (in
+    a worker thread, so serialization and disk IO overlap fetching without
+    blocking the loop). Memory stays O(batch) instead of O(run), and the
+    file is valid up to the last flushed batch if the run dies mid-way.
+
+    Usage:
+        async with ResultWriter("http_results_stream") as writer:
+            ...
+            await writer.put(result)
+    """
+
+    def __init__(self, name: str, batch_size: int = 1024, queue_maxsize: int = 1024):
+        self.path = RESULTS_DIR / f"{name}.parquet"
+        self.batch_size = batch_size
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_maxsize)
+        self._task: asyncio.Task | None = None
+        self._writer: pq.ParquetWriter | None = None
+
+    async def __aenter__(self) -> "ResultWriter":
+        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        self._writer = pq.ParquetWriter(self.path, _RESULT_SCHEMA, compression="zstd")
+        self._task = asyncio.create_task(self._drain())
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        try:
+            if not self._task.done():
+                await self._queue.put(None)  # sentinel: flush and stop
+            await self._task  # re-raises if a flush failed
+        finally:
+            self._writer.close()
+        print(f"Saved {self.path}")
+
+    async def put(self, r: FetchResult) -> None:
+        # If a flush failed (disk full, permissions), the drain task is dead
+        # and nothing consumes the queue: surface its exception here instead
+        # of letting producers block forever once the bounded queue fills.
+        if self._task.done():
+            self._task.result()
+            raise RuntimeError("ResultWriter drain task exited early")
+        await self._queue.put(r)
+
+    async def _drain(self) -> None:
+        sink = ResultSink()
+        while True:
+            r = await self._queue.get()
+            if r is None:
+                break
+            sink.add(r)
+            if len(sink) >= self.batch_size:
+                await self._flush(sink)
+        if len(sink):
+            await self._flush(sink)
+
+    async def _flush(self, sink: ResultSink) -> None:
+        table = pa.Table.from_pydict(sink.to_pydict(), schema=_RESULT_SCHEMA)
+        await asyncio.to_thread(self._writer.write_table, table)
+        sink.clear()
@@ -0,0 +1,62 @@
+"""
+Parse-once URL handling.
+
+A URL used to be re-parsed at the robots check, the host limiter, domain
+attribution, and final aggregation. ParsedURL captures everything those
+consumers need in one memoized pass, so the per-URL urlsplit/tldextract
+cost is paid exactly once per unique URL.
+"""
+
+import functools
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+import tldextract
+
+# Bundled-snapshot extractor: never fetches the public suffix list over
+# the network, which would be a surprise blocking call in the hot path.
+_extract = tldextract.TLDExtract(suffix_list_urls=())
+
+
+@dataclass(slots=True, frozen=True)
+class ParsedURL:
+    """
+    Everything the pipeline wants to know about a URL, parsed once.
+
+    Fields:
+        url                : The original URL string.
+        scheme             : URL scheme ("https" fallback when absent).
+        host               : Network location, including port if present.
+        origin             : scheme://host - key for robots and connection reuse.
+        registrable_domain : Normalized registrable domain (e.g. example.co.uk),
+                             used for grouping/sampling/reporting.
+    """
+    url: str
+    scheme: str
+    host: str
+    origin: str
+    registrable_domain: str | None
+
+
+@functools.lru_cache(maxsize=65536)
+def normalize(url: str) -> ParsedURL:
+    """
+    Parse `url` into a ParsedURL. Memoized: repeat URLs (robots check +
+    fetch + aggregation all normalize the same string) hit the cache.
+    """
+    parts = urlsplit(url)
+    scheme = parts.scheme or "https"
+    host = parts.netloc
+
+    try:
+        registrable = _extract(url).top_domain_under_public_suffix or None
+    except Exception:
+        registrable = None
+
+    return ParsedURL(
+        url=url,
+        scheme=scheme,
+        host=host,
+        origin=f"{scheme}://{host}",
+        registrable_domain=registrable,
+    )
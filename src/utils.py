@@ -1,4 +1,40 @@
+import re
+
 from src.metrics import FetchResult
+from src.url import normalize
+
+# Phrases that mark CAPTCHA / bot-challenge pages. Single source of truth:
+# extend this tuple and both compiled patterns below pick it up. Keep the
+# phrases specific - a generic word like "challenge" would false-positive
+# on ordinary content.
+CAPTCHA_MARKERS = (
+    "captcha",
+    "are you a robot",
+    "verify you are human",
+    "unusual traffic from your",
+    "enable javascript and cookies to continue",
+)
+
+# All markers compiled into one case-insensitive alternation, so re's C
+# engine inspects each haystack byte once regardless of how many markers
+# are registered (Aho-Corasick-style multi-needle scan), with no
+# per-fetch `.lower()` copy. Escaped in case a marker ever contains
+# regex metacharacters.
+_CAPTCHA_RE_STR = re.compile("|".join(re.escape(m) for m in CAPTCHA_MARKERS), re.IGNORECASE)
+_CAPTCHA_RE_BYTES = re.compile(
+    b"|".join(re.escape(m.encode("ascii")) for m in CAPTCHA_MARKERS), re.IGNORECASE
+)
+
+
+def looks_like_captcha(head: bytes | str, limit: int) -> bool:
+    """
+    Heuristic CAPTCHA detection over the first `limit` bytes/chars of a
+    response body or rendered DOM. Accepts bytes (HTTP path) or str
+    (browser path) so neither side pays an encode/decode just to scan.
+    """
+    pattern = _CAPTCHA_RE_BYTES if isinstance(head, bytes) else _CAPTCHA_RE_STR
+    return pattern.search(head, 0, limit) is not None
+
 
 def robots_blocked_result(url: str) -> FetchResult:
     """
@@ -6,6 +42,7 @@ def robots_blocked_result(url: str) -> FetchResult:
     Used when RobotsCache.allowed(url) returns False so that the rest of the
     pipeline can treat it like any other FetchResult row.
     """
+    pu = normalize(url)
     return FetchResult(
         url=url,
         scraper="http",
@@ -14,7 +51,9 @@ def robots_blocked_result(url: str) -> FetchResult:
         ttl_s=0.0,
         ttfb_s=None,
         error_type="robots_blocked",
-        status=None
+        status=None,
+        domain=pu.registrable_domain,
+        parsed=pu,
     )
 
 # Error types for which it is reasonable to retry the HTTP request.
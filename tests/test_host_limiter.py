@@ -0,0 +1,68 @@
+import asyncio
+import time
+
+from src.host_limiter import HostLimiter, TokenBucket
+
+
+def test_per_host_concurrency_is_capped():
+    async def run() -> int:
+        limiter = HostLimiter(per_host=2, rps=0.0)
+        active = 0
+        peak = 0
+
+        async def worker():
+            nonlocal active, peak
+            async with limiter.slot("example.com"):
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(worker() for _ in range(8)))
+        return peak
+
+    assert asyncio.run(run()) <= 2
+
+
+def test_hosts_are_limited_independently():
+    async def run() -> int:
+        limiter = HostLimiter(per_host=1, rps=0.0)
+        active = 0
+        peak = 0
+
+        async def worker(host: str):
+            nonlocal active, peak
+            async with limiter.slot(host):
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(worker("a.com"), worker("b.com"), worker("c.com"))
+        return peak
+
+    # One slot per host, but three hosts may be in flight at once
+    assert asyncio.run(run()) == 3
+
+
+def test_token_bucket_throttles_rate():
+    async def run() -> float:
+        bucket = TokenBucket(rate=50.0, capacity=1.0)
+        t0 = time.monotonic()
+        for _ in range(5):
+            await bucket.acquire()
+        return time.monotonic() - t0
+
+    # 5 acquisitions at 50 rps with a 1-token burst need ~4 refills (~80ms)
+    assert asyncio.run(run()) >= 0.05
+
+
+def test_zero_rate_means_unlimited():
+    async def run() -> float:
+        bucket = TokenBucket(rate=0.0)
+        t0 = time.monotonic()
+        for _ in range(100):
+            await bucket.acquire()
+        return time.monotonic() - t0
+
+    assert asyncio.run(run()) < 0.1
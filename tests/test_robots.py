@@ -0,0 +1,71 @@
+from pathlib import Path
+
+from src.robots import RobotsCache
+from src.settings import ScrapeConfig
+
+
+def make_cache(cache_path: str = "data/_test_robots_cache.jsonl") -> RobotsCache:
+    """Helper: RobotsCache without a live session (parse-only tests)."""
+    return RobotsCache(session=None, config=ScrapeConfig(robots_cache_path=cache_path))
+
+
+def test_full_disallow_for_star_denies():
+    rc = make_cache()
+    content = "User-agent: *\nDisallow: /\n"
+    assert rc._parse_robots(content, "Mozilla/5.0") is False
+
+
+def test_partial_disallow_allows():
+    rc = make_cache()
+    content = "User-agent: *\nDisallow: /private\n"
+    assert rc._parse_robots(content, "Mozilla/5.0") is True
+
+
+def test_disallow_in_other_ua_block_ignored():
+    rc = make_cache()
+    content = "User-agent: OtherBot\nDisallow: /\n\nUser-agent: *\nDisallow: /tmp\n"
+    assert rc._parse_robots(content, "Mozilla/5.0") is True
+
+
+def test_matching_ua_block_denies():
+    rc = make_cache()
+    content = "User-agent: mozilla\nDisallow: /\n"
+    assert rc._parse_robots(content, "Mozilla/5.0") is False
+
+
+def test_comments_and_blank_lines_ignored():
+    rc = make_cache()
+    content = "# robots\n\nUser-agent: *\n# nothing blocked\nDisallow:\n"
+    assert rc._parse_robots(content, "Mozilla/5.0") is True
+
+
+def test_store_persists_and_reloads(tmp_path: Path):
+    cache_file = tmp_path / "robots_cache.jsonl"
+    rc = make_cache(str(cache_file))
+    rc._store("https://example.com", False)
+    rc._store("https://other.com", True)
+    rc._store("https://example.com", True)  # later decision wins
+    rc.close()
+
+    rc2 = make_cache(str(cache_file))
+    assert rc2._get_cached("https://example.com") is True
+    assert rc2._get_cached("https://other.com") is True
+
+
+def test_legacy_dict_format_still_loads(tmp_path: Path):
+    import json
+    import time
+
+    cache_file = tmp_path / "robots_cache.json"
+    cache_file.write_text(
+        json.dumps({"https://legacy.com": {"allowed": False, "ts": time.time()}}),
+        encoding="utf-8",
+    )
+    rc = make_cache(str(cache_file))
+    assert rc._get_cached("https://legacy.com") is False
+
+
+def test_origin_normalization():
+    rc = make_cache()
+    assert rc._origin_from_url("https://example.com/a/b?q=1") == "https://example.com"
+    assert rc._origin_from_url("http://example.com:8080/x") == "http://example.com:8080"
@@ -0,0 +1,18 @@
+from src.utils import CAPTCHA_MARKERS, looks_like_captcha
+
+
+def test_detects_all_markers_case_insensitive():
+    for marker in CAPTCHA_MARKERS:
+        assert looks_like_captcha(f"<html>{marker.upper()}</html>", 4096)
+        assert looks_like_captcha(marker.encode("ascii"), 4096)
+
+
+def test_clean_content_passes():
+    assert not looks_like_captcha(b"<html><body>just an article</body></html>", 4096)
+    assert not looks_like_captcha("<html><body>just an article</body></html>", 4096)
+
+
+def test_detection_respects_limit():
+    body = b"x" * 100 + b"captcha"
+    assert looks_like_captcha(body, 4096)
+    assert not looks_like_captcha(body, 50)